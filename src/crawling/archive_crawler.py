@@ -1,23 +1,24 @@
 #src/crawling/archive_crawler.py
 
 import argparse
+import asyncio
+import atexit
 import csv
-import json
 import logging
 import logging.handlers
 import os
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Annotated, Dict, List, Mapping, Optional, TextIO, Tuple, Union
 from dataclasses import dataclass, asdict
 from urllib.parse import urljoin, parse_qs, urlparse
 
-import requests
-from bs4 import BeautifulSoup
-from pydantic import BaseModel, Field, validator
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+import aiohttp
+from lxml import etree
+import msgspec
+import orjson
 from tqdm import tqdm
 
 """Tehran Times Archive Crawler.
@@ -32,13 +33,22 @@ Typical usage:
 
 # Constants
 BASE_URL = "https://www.tehrantimes.com/page/archive.xhtml"
+ARCHIVE_ORIGIN = "https://www.tehrantimes.com"
 FAILED_PAGES_FILENAME = "failed_pages.csv"
 ACCESS_LOG_FILENAME = "access.log"
 CHECKPOINT_FILENAME = "crawler_state.json"
 ARTICLE_DATA_FILENAME = "articles_{date:%Y%m%d}.json"
+MAX_PAGES_PER_DATE = 5
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+DEFAULT_CONCURRENCY = 8
+LOG_BUFFER_SIZE = 1 << 16
+LOG_FLUSH_INTERVAL = 100  # Rows written between explicit flushes
+MAX_BACKOFF_EXPONENT = 16  # 2 ** 16 s is past any max_backoff; 2.0 ** 1024 overflows
+ARCHIVE_ITEM_CLASSES = frozenset({'clearfix', 'news'})
+ARCHIVE_ITEM_FIELDS = ('link', 'title', 'time_published', 'intro')
 
 # Schema Validation
-class ArticleSchema(BaseModel):
+class ArticleSchema(msgspec.Struct, kw_only=True):
     """Schema for validating scraped articles.
 
     Attributes:
@@ -51,56 +61,223 @@ class ArticleSchema(BaseModel):
         scrape_date: Date when article was scraped
     """
     link: str
-    title: str = Field(..., min_length=1)
+    title: Annotated[str, msgspec.Meta(min_length=1)]
     time_published: str
     intro: str = ""
     downloaded: bool = False
     page: int
     scrape_date: str
 
-    @validator('time_published')
-    def validate_time(cls, v: str) -> str:
+    def __post_init__(self) -> None:
         try:
-            datetime.strptime(v, '%Y-%m-%d %H:%M:%S')
-            return v
+            datetime.strptime(self.time_published, '%Y-%m-%d %H:%M:%S')
         except ValueError:
-            return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self.time_published = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+def resolve_archive_link(href: str) -> str:
+    """Resolve an archive page link to an absolute URL.
+
+    Archive links are almost always absolute or root-relative, which can
+    be resolved with string operations; anything else goes through
+    ``urljoin``.
+    """
+    if href.startswith(('https://', 'http://')):
+        return href
+    if href.startswith('//'):
+        return 'https:' + href
+    if href.startswith('/'):
+        return ARCHIVE_ORIGIN + href
+    return urljoin(BASE_URL, href)
+
+class ArchiveTarget:
+    """lxml parser target that extracts archive entries in one pass.
+
+    The archive page layout is fixed, so instead of building a tree and
+    querying it, this target watches the parser events for
+    ``li.clearfix.news`` items and collects, within each item, the first
+    ``a[href]``, the text of the first ``h3``, the ``title`` of the first
+    ``span.item-time.ltr`` and the text of the first ``p.introtext``.
+
+    Attributes:
+        entries: One dict per complete item, keyed by ``ARCHIVE_ITEM_FIELDS``
+        errors: One message per item missing a field
+    """
+    def __init__(self):
+        self.entries: List[Dict[str, str]] = []
+        self.errors: List[str] = []
+        self._item: Optional[Dict[str, str]] = None
+        self._li_depth: int = 0
+        self._field: Optional[str] = None
+        self._field_depth: int = 0
+        self._text: List[str] = []
+
+    def start(self, tag: str, attrib: Mapping[str, str]) -> None:
+        item = self._item
+        if item is None:
+            if tag == 'li' and ARCHIVE_ITEM_CLASSES <= set(attrib.get('class', '').split()):
+                self._item = {}
+                self._li_depth = 1
+            return
+
+        if tag == 'li':
+            self._li_depth += 1
+        elif tag == 'a' and 'link' not in item and 'href' in attrib:
+            item['link'] = attrib['href']
+        elif tag == 'span' and 'time_published' not in item and attrib.get('class') == 'item-time ltr':
+            item['time_published'] = attrib.get('title', '')
+
+        if self._field is not None:
+            self._field_depth += 1
+        elif tag == 'h3' and 'title' not in item:
+            self._start_text('title')
+        elif tag == 'p' and 'intro' not in item and 'introtext' in attrib.get('class', '').split():
+            self._start_text('intro')
+
+    def _start_text(self, field: str) -> None:
+        self._field = field
+        self._field_depth = 1
+        self._text = []
+
+    def data(self, text: str) -> None:
+        if self._field is not None:
+            self._text.append(text)
+
+    def end(self, tag: str) -> None:
+        item = self._item
+        if item is None:
+            return
+
+        if self._field is not None:
+            self._field_depth -= 1
+            if self._field_depth == 0:
+                item[self._field] = ''.join(self._text).strip()
+                self._field = None
+
+        if tag == 'li':
+            self._li_depth -= 1
+            if self._li_depth == 0:
+                missing: List[str] = [f for f in ARCHIVE_ITEM_FIELDS if f not in item]
+                if missing:
+                    self.errors.append(f"missing {', '.join(missing)}")
+                else:
+                    self.entries.append(item)
+                self._item = None
+
+    def close(self) -> 'ArchiveTarget':
+        return self
+
+@lru_cache(maxsize=None)
+def parser_encoding(charset: Optional[str]) -> Optional[str]:
+    """Return the response charset to hand to libxml2, if it can use it.
+
+    ``None`` (no header, or a charset libxml2 does not know) lets libxml2
+    detect the encoding from the page's ``<meta charset>`` instead.
+    """
+    if charset is None:
+        return None
+    try:
+        etree.HTMLParser(encoding=charset)
+    except LookupError:
+        return None
+    return charset
+
+def parse_archive_page(content: bytes, encoding: Optional[str] = None) -> ArchiveTarget:
+    """Run an archive page through ``ArchiveTarget`` without building a tree.
+
+    Args:
+        content: Raw page body
+        encoding: Charset from the response headers; when missing or
+            unknown, libxml2 falls back to the page's ``<meta charset>``
+    """
+    parser = etree.HTMLParser(target=ArchiveTarget(), encoding=parser_encoding(encoding))
+    parser.feed(content)
+    return parser.close()
 
 class RateLimiter:
     """Controls request rate to prevent overwhelming the server.
 
+    Token bucket that refills at ``requests_per_second`` and holds up to
+    ``burst`` tokens. Server feedback adapts the pace: a 429/5xx or
+    connection failure pauses all requests for ``Retry-After`` seconds
+    or an exponential backoff, and ``X-RateLimit-Remaining: 0`` drains
+    the bucket.
+
     Args:
-        requests_per_second: Maximum number of requests allowed per second
+        requests_per_second: Sustained number of requests allowed per second
+        burst: Maximum number of requests that may be issued back to back
+        max_backoff: Upper bound on the failure backoff, in seconds
     """
-    def __init__(self, requests_per_second: float = 1.0):
-        self.min_interval: float = 1.0 / requests_per_second
-        self.last_request: float = 0.0
-
-    def wait(self) -> None:
-        """Wait if necessary before making next request."""
-        now = time.time()
-        time_passed = now - self.last_request
-        if time_passed < self.min_interval:
-            time.sleep(self.min_interval - time_passed)
-        self.last_request = time.time()
+    def __init__(self, requests_per_second: float = 1.0, burst: int = 1, max_backoff: float = 60.0):
+        self.rate: float = requests_per_second
+        self.burst: int = burst
+        self.max_backoff: float = max_backoff
+        self.tokens: float = float(burst)
+        self.last_refill: float = time.monotonic()
+        self.blocked_until: float = 0.0
+        self.failures: int = 0
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait until a request may be made and consume a token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def record_success(self, headers: Mapping[str, str]) -> None:
+        """Reset the backoff and honor rate limit headers of a response."""
+        self.failures = 0
+        if headers.get('X-RateLimit-Remaining') == '0':
+            self.tokens = 0.0
+
+    def record_failure(self, retry_after: Optional[str] = None) -> float:
+        """Pause all requests after a throttled or failed response.
+
+        Args:
+            retry_after: Value of the ``Retry-After`` header, if any
+
+        Returns:
+            The pause in seconds
+        """
+        self.failures += 1
+        delay: float = min(2.0 ** min(self.failures, MAX_BACKOFF_EXPONENT), self.max_backoff)
+        if retry_after:
+            try:
+                delay = max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        return delay
 
 class RequestManager:
-    """Handles HTTP requests with retry logic and session management.
+    """Handles async HTTP requests with retry logic and session management.
+
+    The underlying ``aiohttp.ClientSession`` must be created inside a
+    running event loop, so call ``open()`` before the first request and
+    ``close()`` when done.
 
     Args:
+        rate_limiter: Limiter informed of every response and used to pace retries
         retry_count: Number of retries for failed requests
-        backoff_factor: Exponential backoff factor between retries
+        limit: Maximum number of simultaneous connections
+        limit_per_host: Maximum number of simultaneous connections per host
     """
-    def __init__(self, retry_count: int = 3, backoff_factor: float = 0.3):
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=retry_count,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+    def __init__(self, rate_limiter: RateLimiter, retry_count: int = 3,
+                 limit: int = 64, limit_per_host: int = 8):
+        self.rate_limiter: RateLimiter = rate_limiter
+        self.retry_count: int = retry_count
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.session: Optional[aiohttp.ClientSession] = None
 
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
@@ -108,9 +285,50 @@ class RequestManager:
             'Accept-Language': 'en-US,en;q=0.9'
         }
 
-    def get(self, url: str, timeout: int = 30) -> requests.Response:
-        """Make GET request with configured retry strategy."""
-        return self.session.get(url, headers=self.headers, timeout=timeout)
+    async def open(self) -> None:
+        """Create the pooled client session."""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+
+    async def close(self) -> None:
+        """Close the client session and release pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def get(self, url: str, timeout: int = 30) -> Tuple[int, bytes, Optional[str]]:
+        """Make GET request with configured retry strategy.
+
+        Callers wait on the rate limiter before the first attempt; retries
+        wait on it internally, so they are paced by the failure backoff.
+        The body is returned undecoded so parsers can read it directly.
+
+        Returns:
+            Tuple of final status code, raw response body and the charset
+            declared in the Content-Type header (or None)
+        """
+        await self.open()
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        for attempt in range(self.retry_count + 1):
+            if attempt:
+                await self.rate_limiter.wait()
+            try:
+                async with self.session.get(url, timeout=client_timeout) as response:
+                    if response.status not in RETRY_STATUS_CODES:
+                        self.rate_limiter.record_success(response.headers)
+                        return response.status, await response.read(), response.charset
+
+                    delay = self.rate_limiter.record_failure(response.headers.get('Retry-After'))
+                    if attempt == self.retry_count:
+                        return response.status, await response.read(), response.charset
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                delay = self.rate_limiter.record_failure()
+                if attempt == self.retry_count:
+                    raise
+
+            logging.debug(f"Retrying {url} in {delay:.1f}s (attempt {attempt + 1})")
 
 class StateManager:
     """Manages crawler state and checkpoints for resume capability.
@@ -131,16 +349,16 @@ class StateManager:
             'timestamp': datetime.now().isoformat()
         }
         temp_file = self.checkpoint_file.with_suffix('.tmp')
-        with open(temp_file, 'w') as f:
-            json.dump(state, f)
+        with open(temp_file, 'wb') as f:
+            f.write(orjson.dumps(state))
         temp_file.replace(self.checkpoint_file)
 
     def load_checkpoint(self) -> Optional[Dict[str, Union[str, int]]]:
         """Load last saved state."""
         try:
             if self.checkpoint_file.exists():
-                with open(self.checkpoint_file, 'r') as f:
-                    return json.load(f)
+                with open(self.checkpoint_file, 'rb') as f:
+                    return orjson.loads(f.read())
         except Exception as e:
             logging.error(f"Error loading checkpoint: {e}")
         return None
@@ -158,16 +376,22 @@ class ArchiveCrawler:
         output_dir: Directory for storing crawled data
         debug: Enable debug logging
         dry_run: Run without saving data
+        concurrency: Maximum number of archive pages fetched at once
+        requests_per_second: Upper bound on request rate
     """
-    def __init__(self, output_dir: str, debug: bool = False, dry_run: bool = False):
+    def __init__(self, output_dir: str, debug: bool = False, dry_run: bool = False,
+                 concurrency: int = DEFAULT_CONCURRENCY, requests_per_second: float = 1.0):
         self.base_url: str = BASE_URL
         self.output_dir: Path = Path(output_dir)
         self.debug: bool = debug
         self.dry_run: bool = dry_run
+        self.concurrency: int = concurrency
 
         # Initialize components
-        self.rate_limiter: RateLimiter = RateLimiter(requests_per_second=1.0)
-        self.request_manager: RequestManager = RequestManager()
+        self.rate_limiter: RateLimiter = RateLimiter(requests_per_second=requests_per_second)
+        self.request_manager: RequestManager = RequestManager(
+            self.rate_limiter, limit=concurrency, limit_per_host=concurrency
+        )
         self.state_manager: StateManager = StateManager(self.output_dir / 'checkpoints')
 
         # Setup directories
@@ -184,14 +408,46 @@ class ArchiveCrawler:
         self.failed_file: Path = self.output_dir / 'failed' / FAILED_PAGES_FILENAME
         self.access_log: Path = self.output_dir / 'logs' / ACCESS_LOG_FILENAME
 
-        # Initialize log files if they don't exist
-        if not self.failed_file.exists():
-            with open(self.failed_file, 'w', newline='') as f:
-                csv.writer(f).writerow(['date', 'page', 'error', 'timestamp'])
-
-        if not self.access_log.exists():
-            with open(self.access_log, 'w', newline='') as f:
-                csv.writer(f).writerow(['timestamp', 'date', 'page', 'status', 'response_time'])
+        # Keep log files open for the crawler's lifetime; rows are buffered
+        # and flushed every LOG_FLUSH_INTERVAL rows and on close()
+        self._failed_fh: TextIO = self._open_csv_log(
+            self.failed_file, ['date', 'page', 'error', 'timestamp']
+        )
+        self._failed_writer = csv.writer(self._failed_fh)
+        self._access_fh: TextIO = self._open_csv_log(
+            self.access_log, ['timestamp', 'date', 'page', 'status', 'response_time']
+        )
+        self._access_writer = csv.writer(self._access_fh)
+        self._rows_since_flush: int = 0
+        atexit.register(self.close)
+
+    @staticmethod
+    def _open_csv_log(path: Path, header: List[str]) -> TextIO:
+        """Open a CSV log for appending, writing the header if it is new."""
+        is_new: bool = not path.exists()
+        fh: TextIO = open(path, 'a', newline='', buffering=LOG_BUFFER_SIZE)
+        if is_new:
+            csv.writer(fh).writerow(header)
+        return fh
+
+    def _row_written(self) -> None:
+        """Flush log buffers periodically so progress survives a hard kill."""
+        self._rows_since_flush += 1
+        if self._rows_since_flush >= LOG_FLUSH_INTERVAL:
+            self.flush_logs()
+
+    def flush_logs(self) -> None:
+        """Flush buffered access and failure log rows to disk."""
+        for fh in (self._access_fh, self._failed_fh):
+            if not fh.closed:
+                fh.flush()
+        self._rows_since_flush = 0
+
+    def close(self) -> None:
+        """Flush and close the access and failure logs."""
+        self.flush_logs()
+        for fh in (self._access_fh, self._failed_fh):
+            fh.close()
 
     def _setup_logging(self) -> None:
         """Configure structured logging."""
@@ -208,27 +464,43 @@ class ArchiveCrawler:
         logger.addHandler(file_handler)
         logger.setLevel(logging.DEBUG if self.debug else logging.INFO)
 
-    def log_access(self, date: datetime, page: int, status: int, response_time: float) -> None:
-        """Log access attempts with structured data."""
-        with open(self.access_log, 'a', newline='') as f:
-            csv.writer(f).writerow([
-                datetime.now().isoformat(),
-                date.strftime('%Y-%m-%d'),
-                page,
-                status,
-                f"{response_time:.2f}"
-            ])
-
-    def log_failed_page(self, date: datetime, page: int, error: str) -> None:
-        """Log failed page attempts."""
-        with open(self.failed_file, 'a', newline='') as f:
-            csv.writer(f).writerow([
-                date.strftime('%Y-%m-%d'),
-                page,
-                str(error),
-                datetime.now().isoformat()
-            ])
-        logging.error(f"Failed page: {date.strftime('%Y-%m-%d')} page {page}: {error}")
+    def log_access(self, date_str: str, page: int, status: int, response_time: float,
+                   timestamp: Optional[str] = None) -> None:
+        """Log access attempts with structured data.
+
+        Args:
+            date_str: Archive date as ``YYYY-MM-DD``
+            page: Page number in archive
+            status: HTTP status code
+            response_time: Request duration in seconds
+            timestamp: Precomputed ISO timestamp (default: now)
+        """
+        self._access_writer.writerow([
+            timestamp or datetime.now().isoformat(),
+            date_str,
+            page,
+            status,
+            f"{response_time:.2f}"
+        ])
+        self._row_written()
+
+    def log_failed_page(self, date_str: str, page: int, error: str, timestamp: Optional[str] = None) -> None:
+        """Log failed page attempts.
+
+        Args:
+            date_str: Archive date as ``YYYY-MM-DD``
+            page: Page number in archive
+            error: Failure description
+            timestamp: Precomputed ISO timestamp (default: now)
+        """
+        self._failed_writer.writerow([
+            date_str,
+            page,
+            str(error),
+            timestamp or datetime.now().isoformat()
+        ])
+        self._row_written()
+        logging.error(f"Failed page: {date_str} page {page}: {error}")
 
     def save_articles(self, date: datetime, articles: List[Dict]) -> None:
         """Save articles with validation."""
@@ -242,7 +514,7 @@ class ArchiveCrawler:
         validated_articles: List[Dict] = []
         for article in articles:
             try:
-                validated = ArticleSchema(**article)
+                msgspec.convert(article, ArticleSchema)
                 validated_articles.append(article)
             except Exception as e:
                 logging.error(f"Validation error for article: {e}")
@@ -257,13 +529,44 @@ class ArchiveCrawler:
             }
         }
 
-        with open(temp_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(temp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         temp_file.replace(filename)
         logging.info(f"Saved {len(validated_articles)} articles for {date.strftime('%Y-%m-%d')}")
 
-    def scrape_page(self, date: datetime, page: int) -> List[Dict]:
+    def _parse_archive_page(self, target: ArchiveTarget, date_str: str, page: int,
+                            timestamp: str) -> List[Dict]:
+        """Build article records from the entries of a parsed archive page.
+
+        Args:
+            target: Parser target the archive page was fed through
+            date_str: Date the page belongs to, as ``YYYY-MM-DD``
+            page: Page number in archive
+            timestamp: ISO timestamp of the request, used for error logs
+
+        Returns:
+            List of dictionaries containing article data
+        """
+        for error in target.errors:
+            self.log_failed_page(date_str, page, f"Parse error: {error}", timestamp)
+
+        articles: List[Dict] = []
+        for entry in target.entries:
+            article_data: Dict[str, Union[str, bool, int]] = {
+                'link': resolve_archive_link(entry['link']),
+                'title': entry['title'],
+                'time_published': entry['time_published'],
+                'intro': entry['intro'],
+                'downloaded': False,
+                'page': page,
+                'scrape_date': date_str
+            }
+            articles.append(article_data)
+
+        return articles
+
+    async def scrape_page(self, date: datetime, page: int) -> List[Dict]:
         """Scrapes a single archive page for the given date.
 
         Args:
@@ -277,47 +580,74 @@ class ArchiveCrawler:
             Logs errors but doesn't raise exceptions to maintain crawler operation
         """
         """Scrape a single page with improved error handling."""
+        date_str: str = date.strftime('%Y-%m-%d')
         url: str = f"{self.base_url}?mn={date.month}&dy={date.day}&yr={date.year}&pi={page}"
 
-        self.rate_limiter.wait()
+        await self.rate_limiter.wait()
         start_time: float = time.time()
 
         try:
-            response: requests.Response = self.request_manager.get(url)
+            status, body, charset = await self.request_manager.get(url)
             response_time: float = time.time() - start_time
+            now_iso: str = datetime.now().isoformat()
 
-            self.log_access(date, page, response.status_code, response_time)
-            logging.info(f"Accessing {date.strftime('%Y-%m-%d')} page {page}: {response.status_code}")
-
-            if response.status_code == 200:
-                soup: BeautifulSoup = BeautifulSoup(response.text, 'html.parser')
-                articles: List[Dict] = []
-
-                for article in soup.select('li.clearfix.news'):
-                    try:
-                        article_data: Dict[str, Union[str, bool, int]] = {
-                            'link': urljoin(self.base_url, article.find('a')['href']),
-                            'title': article.find('h3').text.strip(),
-                            'time_published': article.find('span', class_='item-time ltr').get('title', ''),
-                            'intro': article.find('p', class_='introtext').text.strip(),
-                            'downloaded': False,
-                            'page': page,
-                            'scrape_date': date.strftime('%Y-%m-%d')
-                        }
-                        articles.append(article_data)
-                    except Exception as e:
-                        self.log_failed_page(date, page, f"Parse error: {e}")
-
-                return articles
+            self.log_access(date_str, page, status, response_time, now_iso)
+            logging.info(f"Accessing {date_str} page {page}: {status}")
+
+            if status == 200:
+                # Parse off the event loop so other fetches keep progressing
+                loop = asyncio.get_running_loop()
+                target: ArchiveTarget = await loop.run_in_executor(None, parse_archive_page, body, charset)
+                return self._parse_archive_page(target, date_str, page, now_iso)
             else:
-                self.log_failed_page(date, page, f"Status code: {response.status_code}")
+                self.log_failed_page(date_str, page, f"Status code: {status}", now_iso)
                 return []
 
         except Exception as e:
-            self.log_failed_page(date, page, str(e))
-            logging.error(f"Error scraping {date.strftime('%Y-%m-%d')} page {page}: {str(e)}")
+            self.log_failed_page(date_str, page, str(e))
+            logging.error(f"Error scraping {date_str} page {page}: {str(e)}")
             return []
 
+    async def crawl_date(self, date: datetime, semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Fetch a date's archive pages in order, stopping at the first empty page.
+
+        Pages of one date are fetched one after another so no request is
+        spent past the last page; concurrency comes from crawling several
+        dates at once.
+        """
+        articles: List[Dict] = []
+        for page in range(1, MAX_PAGES_PER_DATE + 1):
+            async with semaphore:
+                page_articles: List[Dict] = await self.scrape_page(date, page)
+            if not page_articles:  # No more articles for this date
+                break
+            articles.extend(page_articles)
+        return articles
+
+    async def _crawl(self, dates: List[datetime]) -> None:
+        """Crawl dates in windows, saving and checkpointing in date order."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        window: int = self.concurrency * 4  # Dates in flight; each holds at most one request
+
+        try:
+            with tqdm(total=len(dates), desc="Crawling dates") as pbar:
+                for i in range(0, len(dates), window):
+                    batch: List[datetime] = dates[i:i + window]
+                    pbar.set_description(f"Crawling {batch[0].strftime('%Y-%m-%d')}")
+
+                    results: List[List[Dict]] = await asyncio.gather(
+                        *(self.crawl_date(date, semaphore) for date in batch)
+                    )
+
+                    for date, articles in zip(batch, results):
+                        if articles:
+                            self.save_articles(date, articles)
+                            self.state_manager.save_checkpoint(date, max(a['page'] for a in articles))
+                        pbar.update()
+        finally:
+            await self.request_manager.close()
+            self.flush_logs()
+
     def run(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> None:
         """Runs the crawler for the specified date range.
 
@@ -346,37 +676,29 @@ class ArchiveCrawler:
 
         logging.info(f"Starting crawl from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
 
-        with tqdm(dates, desc="Crawling dates") as pbar:
-            for date in pbar:
-                articles: List[Dict] = []
-                pbar.set_description(f"Crawling {date.strftime('%Y-%m-%d')}")
-
-                for page in range(1, 6):  # Assuming max 5 pages per date
-                    if self.dry_run:
-                        continue
-
-                    page_articles: List[Dict] = self.scrape_page(date, page)
-                    articles.extend(page_articles)
-
-                    if not page_articles:  # No more articles for this date
-                        break
-
-                    self.state_manager.save_checkpoint(date, page)
-
-                if articles:
-                    self.save_articles(date, articles)
+        if self.dry_run:
+            for date in tqdm(dates, desc="Crawling dates"):
+                pass
+            return
 
-                pbar.update()
+        asyncio.run(self._crawl(dates))
 
 def main() -> None:
     parser = argparse.ArgumentParser(description='Tehran Times Archive Crawler')
     parser.add_argument('--output', required=True, help='Output directory for scraped content')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--dry-run', action='store_true', help='Dry run without saving')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Maximum number of concurrent page requests')
+    parser.add_argument('--rate', type=float, default=1.0,
+                        help='Maximum requests per second; --concurrency only overlaps latency below this cap')
 
     args: argparse.Namespace = parser.parse_args()
 
-    crawler: ArchiveCrawler = ArchiveCrawler(args.output, args.debug, args.dry_run)
+    crawler: ArchiveCrawler = ArchiveCrawler(
+        args.output, args.debug, args.dry_run,
+        concurrency=args.concurrency, requests_per_second=args.rate
+    )
 
     try:
         crawler.run()
@@ -16,22 +16,29 @@ Features:
 """
 
 import argparse
-import json
+import asyncio
+import atexit
 import logging
-import time
-import random
-from datetime import datetime, timedelta
+import multiprocessing
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
-import requests
-from bs4 import BeautifulSoup
-from pydantic import BaseModel, Field, validator
+import lxml.html
+import msgspec
+import orjson
+from lxml import etree
 from tqdm import tqdm
 from urllib.parse import urljoin
 
+from archive_crawler import RateLimiter, RequestManager, parser_encoding
+
 # Constants
 STATE_DIR_NAME = "state"
 RESULTS_DIR_NAME = "results"
@@ -39,15 +46,43 @@ LOGS_DIR_NAME = "logs"
 STATE_FILE_NAME = "crawler_state.json"
 URLS_FILE_NAME = "urls_state.json"
 IMAGES_FILE_NAME = "images_state.json"
-ARTICLE_OUTPUT_FILENAME = "{date}_articles.json"
+URLS_LOG_FILE_NAME = "urls_state.log"
+IMAGES_LOG_FILE_NAME = "images_state.log"
+STATE_FLUSH_INTERVAL = 500  # Mutations between state snapshots
+STATE_IO_BUFFER_SIZE = 1 << 20  # State snapshots run to several MB
+DAY_FILE_CACHE_SIZE = 4  # Per-day output files kept open at once
+# Parser workers start from a clean server process, never forked from the
+# threaded event loop (aiohttp resolver, tqdm monitor); Windows only has spawn
+PARSER_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Article page XPaths, compiled once instead of on every page
+def _has_class(name: str) -> str:
+    """Return an XPath predicate equivalent to the CSS selector ``.name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+XP_TEXT = etree.XPath(
+    f"(//*[{_has_class('item-text')}])[1]//text()[not(ancestor::script or ancestor::style)]"
+)
+XP_TITLE = etree.XPath(f"(//h2[{_has_class('item-title')}])[1]")
+XP_DATE = etree.XPath(f"(//*[{_has_class('item-date')}])[1]")
+XP_SUMMARY = etree.XPath(f"(//p[{_has_class('summary')}])[1]")
+XP_TAGS = etree.XPath(f"//*[{_has_class('tags')}]//a")
+XP_BREADCRUMB = etree.XPath(f"(//*[{_has_class('breadcrumb')}]//li//a)[1]")
+XP_RELATED = etree.XPath(f"//*[{_has_class('related-items')}]//a/@href")
+XP_IMAGES = etree.XPath("//img/@src")
+ARTICLE_OUTPUT_FILENAME = "{date}_articles.jsonl"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_BURST = 5
+REQUEST_TIMEOUT = 30  # Seconds per request, including the body
 
 # Data Models
 @dataclass
 class DateRange:
     """Results of date coverage analysis."""
-    start_date: datetime
-    end_date: datetime
-    missing_dates: List[datetime]
+    start_date: date
+    end_date: date
+    missing_dates: List[date]
     total_articles: int
     date_distribution: Dict[str, int]
 
@@ -68,7 +103,7 @@ class LinkInfo:
     downloaded: bool = False
     status: ScrapingStatus = ScrapingStatus.PENDING
 
-class ArticleSchema(BaseModel):
+class ArticleSchema(msgspec.Struct, kw_only=True):
     """Validation schema for article content."""
     url: str
     first_seen_date: str
@@ -79,23 +114,29 @@ class ArticleSchema(BaseModel):
     scraped_date: str
     summary: str = ""
     body: str
-    tags: List[str] = Field(default_factory=list)
+    tags: List[str] = []
     category: str
-    images: List[str] = Field(default_factory=list)
-    related_articles: List[str] = Field(default_factory=list)
+    images: List[str] = []
+    related_articles: List[str] = []
     download_timestamp: str
 
-    @validator('download_timestamp')
-    def validate_timestamp(cls, v: str) -> str:
+    def __post_init__(self) -> None:
         """Ensure timestamp is in ISO format."""
         try:
-            datetime.fromisoformat(v)
-            return v
+            datetime.fromisoformat(self.download_timestamp)
         except ValueError:
-            return datetime.now().isoformat()
+            self.download_timestamp = datetime.now().isoformat()
 
 class StateManager:
-    """Manages crawler state using JSON files."""
+    """Manages crawler state using JSON files.
+
+    URL and image state is held in memory. Every mutation is appended to
+    a JSON Lines write-ahead log, and the full state is snapshotted to the
+    JSON files every ``STATE_FLUSH_INTERVAL`` mutations, after which the
+    logs are truncated. On startup the logs are replayed over the
+    snapshots, so no update is lost if the crawler dies between
+    snapshots.
+    """
 
     def __init__(self, state_dir: Path):
         self.state_dir: Path = state_dir
@@ -103,61 +144,277 @@ class StateManager:
         self.state_file: Path = state_dir / STATE_FILE_NAME
         self.urls_file: Path = state_dir / URLS_FILE_NAME
         self.images_file: Path = state_dir / IMAGES_FILE_NAME
+        self.urls_log: Path = state_dir / URLS_LOG_FILE_NAME
+        self.images_log: Path = state_dir / IMAGES_LOG_FILE_NAME
         self._init_state_files()
 
+        self._urls: Dict[str, Dict[str, Union[str, None]]] = self._load_state(self.urls_file)
+        self._images: Dict[str, Dict[str, str]] = self._load_state(self.images_file)
+        replayed: int = self._replay_log(self.urls_log, self._urls)
+        replayed += self._replay_log(self.images_log, self._images)
+
+        self._urls_log_fh: BinaryIO = self._open_log(self.urls_log)
+        self._images_log_fh: BinaryIO = self._open_log(self.images_log)
+        # Replayed entries are not in the snapshots yet
+        self._dirty_counter: int = replayed
+
+        # Snapshot on interpreter exit even if the crawler never reaches close()
+        atexit.register(self.close)
+
     def _init_state_files(self) -> None:
         """Initialize state files if they don't exist."""
         for file_path in [self.state_file, self.urls_file, self.images_file]:
             if not file_path.exists():
-                self._save_json(file_path, {})
+                self._save_json_compact(file_path, {})
 
-    def _save_json(self, file_path: Path, data: dict) -> None:
-        """Save JSON with atomic write."""
+    def _save_json_compact(self, file_path: Path, data: dict) -> bool:
+        """Save compact JSON with atomic write.
+
+        State files are only read back by the crawler, so they skip the
+        indentation used for the archive files people inspect. The data
+        and the rename are fsynced before returning, so the write-ahead
+        logs can be truncated safely afterwards.
+
+        Returns:
+            True if the snapshot reached disk, False if it failed
+        """
         temp_file = file_path.with_suffix('.tmp')
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            temp_file.replace(file_path)
+            with open(temp_file, 'wb', buffering=STATE_IO_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, file_path)
+            self._fsync_dir()
+            return True
         except Exception as e:
             logging.error(f"Error saving {file_path}: {e}")
             if temp_file.exists():
                 temp_file.unlink()
+            return False
+
+    def _fsync_dir(self) -> None:
+        """Persist renames in the state directory (not supported on Windows)."""
+        if os.name == 'nt':
+            return
+        dir_fd: int = os.open(self.state_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _open_log(self, log_file: Path) -> BinaryIO:
+        """Open a write-ahead log for appending.
+
+        A last line cut off by a crash is terminated first, so the next
+        entry does not get glued onto it.
+        """
+        fh: BinaryIO = open(log_file, 'ab')
+        if fh.tell() > 0:
+            with open(log_file, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    fh.write(b'\n')
+                    fh.flush()
+        return fh
+
+    def _replay_log(self, log_file: Path, state: Dict) -> int:
+        """Apply logged mutations newer than the last snapshot.
+
+        Returns:
+            Number of mutations applied
+        """
+        applied: int = 0
+        if not log_file.exists():
+            return applied
+        with open(log_file, 'rb', buffering=STATE_IO_BUFFER_SIZE) as f:
+            for line in f:
+                try:
+                    key, value = orjson.loads(line)
+                except (ValueError, TypeError):
+                    logging.error(f"Skipping malformed entry in {log_file}")
+                    continue
+                state[key] = value
+                applied += 1
+        return applied
+
+    def _append_log(self, fh: BinaryIO, entries: List[Tuple[str, Dict]]) -> None:
+        """Append mutations to a write-ahead log in a single write."""
+        fh.write(b''.join(orjson.dumps(entry) + b'\n' for entry in entries))
+        fh.flush()
+        self._dirty_counter += len(entries)
+        self.flush()
+
+    def flush(self, force: bool = False) -> None:
+        """Snapshot in-memory state to disk and truncate the logs.
+
+        Args:
+            force: Snapshot any pending mutations, not only once
+                ``STATE_FLUSH_INTERVAL`` of them have accumulated
+        """
+        if self._dirty_counter == 0:
+            return
+        if not force and self._dirty_counter < STATE_FLUSH_INTERVAL:
+            return
+        saved: bool = self._save_json_compact(self.urls_file, self._urls)
+        saved = self._save_json_compact(self.images_file, self._images) and saved
+        if not saved:
+            # Keep the logs; they still hold every mutation since the last good snapshot
+            return
+        for fh in (self._urls_log_fh, self._images_log_fh):
+            fh.seek(0)
+            fh.truncate()
+        self._dirty_counter = 0
+
+    def close(self) -> None:
+        """Flush state and close the write-ahead logs."""
+        if self._urls_log_fh.closed:
+            return
+        self.flush(force=True)
+        self._urls_log_fh.close()
+        self._images_log_fh.close()
+
+    def urls_with_status(self, status: ScrapingStatus) -> Set[str]:
+        """Return the URLs whose last recorded status is ``status``."""
+        return {url for url, entry in self._urls.items() if entry.get('status') == status.value}
 
     def update_url_status(self, url: str, status: ScrapingStatus, error: Optional[str] = None) -> None:
         """Update URL processing status."""
-        urls_state: Dict[str, Dict[str, Union[str, None]]] = self._load_state(self.urls_file)
-        urls_state[url] = {
+        entry: Dict[str, Union[str, None]] = {
             'last_attempt': datetime.now().isoformat(),
             'status': status.value,
             'error': error
         }
-        self._save_json(self.urls_file, urls_state)
+        self._urls[url] = entry
+        self._append_log(self._urls_log_fh, [(url, entry)])
 
     def track_image(self, image_url: str, article_url: str) -> None:
         """Track image URL and its article association."""
-        images_state: Dict[str, Dict[str, str]] = self._load_state(self.images_file)
-        images_state[image_url] = {
-            'article_url': article_url,
-            'found_date': datetime.now().isoformat()
-        }
-        self._save_json(self.images_file, images_state)
+        self.track_images([(image_url, article_url)])
+
+    def track_images(self, pairs: List[Tuple[str, str]]) -> None:
+        """Track several images at once with a single log append.
+
+        Args:
+            pairs: ``(image_url, article_url)`` tuples
+        """
+        if not pairs:
+            return
+        found_date: str = datetime.now().isoformat()
+        entries: List[Tuple[str, Dict]] = []
+        for image_url, article_url in pairs:
+            entry: Dict[str, str] = {
+                'article_url': article_url,
+                'found_date': found_date
+            }
+            self._images[image_url] = entry
+            entries.append((image_url, entry))
+        self._append_log(self._images_log_fh, entries)
 
     def _load_state(self, file_path: Path) -> Dict:
         """Load state file with error handling."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return orjson.loads(file_path.read_bytes())
         except Exception as e:
             logging.error(f"Error loading state from {file_path}: {e}")
             return {}
 
+def _parse_date_file(json_file: Path) -> Tuple[Optional[str], int, Optional[str]]:
+    """Read an archive file's date and article count.
+
+    Defined at module level so it can be pickled into worker processes.
+
+    Returns:
+        Tuple of date string, article count and error message (if any)
+    """
+    try:
+        data: Dict = orjson.loads(json_file.read_bytes())
+        return data['date'], len(data['articles']), None
+    except Exception as e:
+        return None, 0, str(e)
+
+def _required_text(xpath: etree.XPath, root: lxml.html.HtmlElement) -> str:
+    """Return the stripped text of the element matched by ``xpath``.
+
+    Raises:
+        ValueError: If the element is missing from the page
+    """
+    elements = xpath(root)
+    if not elements:
+        raise ValueError(f"Missing element: {xpath.path}")
+    return elements[0].text_content().strip()
+
+def _optional_text(xpath: etree.XPath, root: lxml.html.HtmlElement) -> str:
+    """Return the stripped text of the element matched by ``xpath``, or ''."""
+    elements = xpath(root)
+    return elements[0].text_content().strip() if elements else ''
+
+def _extract_images(root: lxml.html.HtmlElement, article_url: str) -> List[str]:
+    """Extract absolute image URLs from an article page."""
+    return [urljoin(article_url, src) for src in XP_IMAGES(root) if src]
+
+def _extract_article_content(root: lxml.html.HtmlElement, link_info: LinkInfo) -> Dict:
+    """Extract content from article page.
+
+    Raises:
+        Exception: If a required element is missing or validation fails
+    """
+    main_text: str = ' '.join(
+        text for text in (chunk.strip() for chunk in XP_TEXT(root)) if text
+    )
+
+    content: Dict[str, Union[str, List[str]]] = {
+        'url': link_info.url,
+        'first_seen_date': link_info.first_seen_date,
+        'original_title': link_info.title,
+        'original_intro': link_info.intro,
+        'original_time': link_info.time_published,
+        'scraped_title': _required_text(XP_TITLE, root),
+        'scraped_date': _required_text(XP_DATE, root),
+        'summary': _optional_text(XP_SUMMARY, root),
+        'body': main_text,
+        'tags': [tag.text_content() for tag in XP_TAGS(root)],
+        'category': _required_text(XP_BREADCRUMB, root),
+        'images': _extract_images(root, link_info.url),
+        'related_articles': [str(href) for href in XP_RELATED(root)],
+        'download_timestamp': datetime.now().isoformat()
+    }
+
+    return msgspec.to_builtins(msgspec.convert(content, ArticleSchema))
+
+@lru_cache(maxsize=None)
+def _article_parser(encoding: Optional[str]) -> lxml.html.HTMLParser:
+    """Return the shared article parser for a response charset.
+
+    Comments, processing instructions and the id index are never queried,
+    so the parser skips building them.
+    """
+    return lxml.html.HTMLParser(
+        encoding=encoding, remove_comments=True, remove_pis=True, collect_ids=False
+    )
+
+def _parse_article_worker(body: bytes, encoding: Optional[str], link_info: LinkInfo) -> Dict:
+    """Parse an article page and return its validated content.
+
+    Runs in the crawler's parser process pool, so it only takes and
+    returns picklable values. The raw body is decoded by libxml2 itself,
+    using the response charset or, failing that, the page's
+    ``<meta charset>``.
+    """
+    parser: lxml.html.HTMLParser = _article_parser(parser_encoding(encoding))
+    root = lxml.html.document_fromstring(body, parser=parser)
+    return _extract_article_content(root, link_info)
+
 class TehranTimesCrawler:
     """Main crawler implementation."""
 
-    def __init__(self, input_dir: str, output_dir: str, debug: bool = False):
+    def __init__(self, input_dir: str, output_dir: str, debug: bool = False,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND):
         self.input_dir: Path = Path(input_dir)
         self.output_dir: Path = Path(output_dir)
         self.debug: bool = debug
+        self.concurrency: int = concurrency
 
         # Initialize directories
         self.state_dir: Path = self.output_dir / STATE_DIR_NAME
@@ -169,15 +426,61 @@ class TehranTimesCrawler:
         # Initialize components
         self.state_manager: StateManager = StateManager(self.state_dir)
 
+        # URLs scraped successfully in earlier runs or queued in this one
+        self._done_urls: Set[str] = self.state_manager.urls_with_status(ScrapingStatus.SUCCESS)
+
         # Setup logging
         self._setup_logging()
 
-        # Request configuration
-        self.headers: Dict[str, str] = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9',
-            'Accept-Language': 'en-US,en;q=0.9'
-        }
+        # One pooled keep-alive session, shared retry handling with the archive crawler
+        self.rate_limiter: RateLimiter = RateLimiter(requests_per_second, burst=DEFAULT_BURST)
+        self.request_manager: RequestManager = RequestManager(
+            self.rate_limiter, limit=concurrency, limit_per_host=concurrency
+        )
+
+        # HTML parsing is CPU bound, so it runs in worker processes
+        self.parser_pool: Optional[ProcessPoolExecutor] = None
+
+        # Valid input files found by analyze_dates, reused by the producer
+        self._file_index: Optional[List[Path]] = None
+
+        # LRU of per-day output handles; per-day URL index kept for the whole run
+        self._out_fh: OrderedDict[str, BinaryIO] = OrderedDict()
+        self._saved_urls: Dict[str, Set[str]] = {}
+
+        # Articles written to the output buffers but not yet flushed or marked SUCCESS
+        self._unflushed: List[Dict] = []
+
+    async def close(self) -> None:
+        """Release pooled HTTP connections, parser workers and output files."""
+        await self.request_manager.close()
+        if self.parser_pool is not None:
+            self.parser_pool.shutdown()
+            self.parser_pool = None
+        self.flush_outputs()
+        for fh in self._out_fh.values():
+            fh.close()
+        self._out_fh.clear()
+        self._saved_urls.clear()
+        self.state_manager.flush(force=True)
+
+    async def _fetch(self, url: str) -> Tuple[bytes, Optional[str]]:
+        """Fetch a page body, paced by the shared rate limiter.
+
+        Throttled (429/5xx) responses and connection failures are retried
+        by the request manager, which backs off through the limiter.
+
+        Returns:
+            Tuple of raw page body and the charset declared by the server
+
+        Raises:
+            ValueError: If the final response is not successful
+        """
+        await self.rate_limiter.wait()
+        status, body, charset = await self.request_manager.get(url, timeout=REQUEST_TIMEOUT)
+        if status >= 400:
+            raise ValueError(f"Status code: {status}")
+        return body, charset
 
     def _setup_logging(self) -> None:
         """Configure logging with rotation."""
@@ -188,151 +491,272 @@ class TehranTimesCrawler:
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
 
+    def _iter_input_files(self) -> Iterator[Path]:
+        """Yield the archive JSON files in the input directory.
+
+        Uses ``os.scandir`` so file types come from the directory entry
+        instead of a ``stat`` call per file.
+        """
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    yield Path(entry.path)
+
     def analyze_dates(self) -> DateRange:
-        """Analyze date coverage of articles."""
-        dates_articles: Dict[str, int] = {}
-        all_dates: Set[datetime] = set()
+        """Analyze date coverage of articles.
 
-        for json_file in self.input_dir.glob('*.json'):
-            try:
-                data: Dict = json.loads(json_file.read_text(encoding='utf-8'))
-                date: datetime = datetime.strptime(data['date'], '%Y-%m-%d')
-                article_count: int = len(data['articles'])
-                dates_articles[date.strftime('%Y-%m-%d')] = article_count
-                all_dates.add(date)
-            except Exception as e:
-                logging.error(f"Error analyzing {json_file}: {e}")
+        The files that parse cleanly are cached in ``_file_index`` so the
+        crawl does not list the input directory again.
+        """
+        dates_articles: Dict[str, int] = {}
+        all_dates: Set[date] = set()
+        json_files: List[Path] = list(self._iter_input_files())
+        file_index: List[Path] = []
+
+        # Process start-up is expensive on Windows (spawn), where threads suffice for the I/O
+        executor_cls: type[Executor] = ThreadPoolExecutor if os.name == 'nt' else ProcessPoolExecutor
+        with executor_cls(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_parse_date_file, json_files, chunksize=32)
+            for json_file, (date_str, article_count, error) in zip(json_files, results):
+                try:
+                    if error:
+                        raise ValueError(error)
+                    day: date = date.fromisoformat(date_str)
+                    dates_articles[day.isoformat()] = article_count
+                    all_dates.add(day)
+                    file_index.append(json_file)
+                except Exception as e:
+                    logging.error(f"Error analyzing {json_file}: {e}")
 
         if not all_dates:
             raise ValueError("No valid dates found")
+        self._file_index = file_index
 
-        min_date: datetime = min(all_dates)
-        max_date: datetime = max(all_dates)
+        min_date: date = min(all_dates)
+        max_date: date = max(all_dates)
 
-        expected_dates: Set[datetime] = {
-            min_date + timedelta(days=x)
-            for x in range((max_date - min_date).days + 1)
-        }
+        # Walk the range as ordinals rather than building a set of every expected date
+        seen: Set[int] = {day.toordinal() for day in all_dates}
+        missing_dates: List[date] = [
+            date.fromordinal(ordinal)
+            for ordinal in range(min_date.toordinal(), max_date.toordinal() + 1)
+            if ordinal not in seen
+        ]
 
         return DateRange(
             start_date=min_date,
             end_date=max_date,
-            missing_dates=sorted(list(expected_dates - all_dates)),  # Convert set to list for sorting
+            missing_dates=missing_dates,  # Already in ascending order
             total_articles=sum(dates_articles.values()),
             date_distribution=dates_articles
         )
 
-    def _extract_article_content(self, soup: BeautifulSoup, link_info: LinkInfo) -> Optional[Dict]:
-        """Extract content from article page."""
+    async def process_article(self, link_info: LinkInfo) -> Optional[Dict]:
+        """Process a single article."""
         try:
-            text_div = soup.select_one('.item-text')
-            main_text: str = ' '.join(
-                text for text in text_div.stripped_strings
-            ) if text_div else ''
-
-            content: Dict[str, Union[str, List[str]]] = {
-                'url': link_info.url,
-                'first_seen_date': link_info.first_seen_date,
-                'original_title': link_info.title,
-                'original_intro': link_info.intro,
-                'original_time': link_info.time_published,
-                'scraped_title': soup.select_one('h2.item-title').text.strip(),
-                'scraped_date': soup.select_one('.item-date').text.strip(),
-                'summary': soup.select_one('p.summary').text.strip() if soup.select_one('p.summary') else '',
-                'body': main_text,
-                'tags': [tag.text for tag in soup.select('.tags a')],
-                'category': soup.select_one('.breadcrumb li a').text.strip(),
-                'images': self._extract_images(soup, link_info.url),
-                'related_articles': [a['href'] for a in soup.select('.related-items a')],
-                'download_timestamp': datetime.now().isoformat()
-            }
+            body, charset = await self._fetch(link_info.url)
+
+            if self.parser_pool is None:
+                self.parser_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context(PARSER_START_METHOD)
+                )
+            loop = asyncio.get_running_loop()
+            content: Dict = await loop.run_in_executor(
+                self.parser_pool, _parse_article_worker, body, charset, link_info
+            )
+
+            # Marked SUCCESS by flush_outputs once the article is on disk
+            return content
 
-            return ArticleSchema(**content).dict()
         except Exception as e:
-            logging.error(f"Content extraction error: {e}")
-            if self.debug:
-                raise
+            logging.error(f"Failed to process {link_info.url}: {e}")
+            self._record_failure(link_info.url, e)
             return None
 
-    def _extract_images(self, soup: BeautifulSoup, article_url: str) -> List[str]:
-        """Extract and track image URLs."""
-        images: List[str] = []
-        for img in soup.find_all('img'):
-            src = img.get('src')
-            if src:
-                full_url: str = urljoin(article_url, src)
-                images.append(full_url)
-                self.state_manager.track_image(full_url, article_url)
-        return images
-
-    def process_article(self, link_info: LinkInfo) -> Optional[Dict]:
-        """Process a single article."""
+    def _record_failure(self, url: str, error: Exception) -> None:
+        """Mark a URL FAILED from a pipeline task's error handler.
+
+        A state write that fails here (a full disk, say) is logged rather
+        than raised, so it cannot end the worker or writer task.
+        """
         try:
-            response: requests.Response = requests.get(
-                link_info.url,
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
+            self.state_manager.update_url_status(url, ScrapingStatus.FAILED, str(error))
+        except Exception as e:
+            logging.error(f"Error recording failure of {url}: {e}")
 
-            content: Optional[Dict] = self._extract_article_content(
-                BeautifulSoup(response.text, 'html.parser'),
-                link_info
-            )
+    def _open_day_file(self, date_str: str) -> BinaryIO:
+        """Return the append handle for a day's JSONL output.
 
-            if content:
-                self.state_manager.update_url_status(
-                    link_info.url,
-                    ScrapingStatus.SUCCESS
-                )
-                return content
-            else:
-                raise Exception("Failed to extract content")
+        The existing file is scanned only the first time a day is opened;
+        its URL index outlives the handle, so a day evicted from the LRU
+        is reopened without being read again.
+        """
+        fh: Optional[BinaryIO] = self._out_fh.get(date_str)
+        if fh is not None:
+            self._out_fh.move_to_end(date_str)
+            return fh
 
-        except Exception as e:
-            logging.error(f"Failed to process {link_info.url}: {e}")
-            self.state_manager.update_url_status(
-                link_info.url,
-                ScrapingStatus.FAILED,
-                str(e)
+        if len(self._out_fh) >= DAY_FILE_CACHE_SIZE:
+            _, evicted_fh = self._out_fh.popitem(last=False)
+            evicted_fh.close()
+
+        output_file: Path = self.results_dir / ARTICLE_OUTPUT_FILENAME.format(date=date_str)
+        needs_newline: bool = False
+        if date_str not in self._saved_urls:
+            saved_urls: Set[str] = set()
+            if output_file.exists():
+                with open(output_file, 'rb') as f:
+                    for line in f:
+                        needs_newline = not line.endswith(b'\n')
+                        try:
+                            saved_urls.add(orjson.loads(line)['url'])
+                        except (orjson.JSONDecodeError, KeyError):
+                            logging.error(f"Skipping malformed line in {output_file}")
+            self._saved_urls[date_str] = saved_urls
+
+        fh = open(output_file, 'ab')
+        if needs_newline:  # Previous run was interrupted mid-line
+            fh.write(b'\n')
+        self._out_fh[date_str] = fh
+        return fh
+
+    def flush_outputs(self) -> None:
+        """Flush all open per-day output files.
+
+        Articles written since the last flush are only marked SUCCESS
+        (and their images tracked) once their lines have reached the OS,
+        so the state never claims an article that is not on disk.
+        """
+        for fh in self._out_fh.values():
+            fh.flush()
+        for article in self._unflushed:
+            self.state_manager.track_images(
+                [(image_url, article['url']) for image_url in article['images']]
             )
-            return None
+            self.state_manager.update_url_status(article['url'], ScrapingStatus.SUCCESS)
+        self._unflushed.clear()
 
     def save_article(self, article: Dict) -> None:
-        """Save processed article."""
-        date_str: str = datetime.fromisoformat(article['first_seen_date']).strftime('%Y-%m-%d')
-        output_file: Path = self.results_dir / ARTICLE_OUTPUT_FILENAME.format(date=date_str)
+        """Append processed article to its day's JSONL file.
 
-        existing_articles: List[Dict] = []
-        if output_file.exists():
-            try:
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    existing_articles = json.load(f)
-            except json.JSONDecodeError:
-                logging.error(f"Error loading existing articles for {date_str}")
-
-        # Update or append article
-        article_index: Optional[int] = next(
-            (i for i, a in enumerate(existing_articles)
-             if a['url'] == article['url']),
-            None
-        )
+        Raises:
+            Exception: If the article cannot be written
+        """
+        # first_seen_date comes from the archive file's YYYY-MM-DD date
+        date_str: str = article['first_seen_date'][:10]
+        fh: BinaryIO = self._open_day_file(date_str)
 
-        if article_index is not None:
-            existing_articles[article_index] = article
+        if article['url'] in self._saved_urls[date_str]:
+            logging.debug(f"Article already saved: {article['url']}")
         else:
-            existing_articles.append(article)
+            fh.write(orjson.dumps(article) + b'\n')
+            self._saved_urls[date_str].add(article['url'])
+        self._unflushed.append(article)
+
+    def _load_link_infos(self, json_file: Path) -> List[LinkInfo]:
+        """Read the article links listed in one archive file."""
+        data: Dict = orjson.loads(json_file.read_bytes())
+        return [
+            LinkInfo(
+                url=article_data['link'],
+                first_seen_date=data['date'],
+                title=article_data.get('title', ''),
+                intro=article_data.get('intro', ''),
+                time_published=article_data.get('time_published', '')
+            )
+            for article_data in data['articles']
+        ]
+
+    async def _produce(self, link_queue: asyncio.Queue, pbar: tqdm) -> None:
+        """Enqueue the article links of every input file."""
+        json_files: Iterable[Path] = self._file_index if self._file_index is not None else self._iter_input_files()
+        for json_file in json_files:
+            try:
+                link_infos: List[LinkInfo] = self._load_link_infos(json_file)
+            except Exception as e:
+                logging.error(f"Error processing {json_file}: {e}")
+                if self.debug:
+                    raise
+                continue
+
+            pending: List[LinkInfo] = []
+            for link_info in link_infos:
+                if link_info.url not in self._done_urls:
+                    self._done_urls.add(link_info.url)
+                    pending.append(link_info)
+
+            pbar.total += len(pending)
+            pbar.refresh()
+            for link_info in pending:
+                await link_queue.put(link_info)
+
+    async def _consume(self, link_queue: asyncio.Queue, result_queue: asyncio.Queue, pbar: tqdm) -> None:
+        """Fetch and extract queued articles until cancelled."""
+        while True:
+            link_info: LinkInfo = await link_queue.get()
+            try:
+                content: Optional[Dict] = await self.process_article(link_info)
+                if content:
+                    await result_queue.put(content)
+            finally:
+                pbar.update()
+                link_queue.task_done()
+
+    async def _write(self, result_queue: asyncio.Queue) -> None:
+        """Save extracted articles until cancelled.
+
+        A single writer keeps appends to each day's output file sequential.
+        """
+        while True:
+            content: Dict = await result_queue.get()
+            try:
+                self.save_article(content)
+                if result_queue.empty():
+                    self.flush_outputs()
+            except Exception as e:
+                logging.error(f"Error saving {content.get('url')}: {e}")
+                self._record_failure(content['url'], e)
+            finally:
+                result_queue.task_done()
+
+    async def _drain(self, link_queue: asyncio.Queue, result_queue: asyncio.Queue, pbar: tqdm) -> None:
+        """Enqueue every link, then wait until all of them are saved."""
+        await self._produce(link_queue, pbar)
+        await link_queue.join()
+        await result_queue.join()
+
+    async def _run_async(self) -> None:
+        """Stream links from the input files through a pool of fetch workers.
+
+        One producer reads input files, ``concurrency`` workers fetch and
+        extract articles, and one writer saves the results. Workers and the
+        writer only ever stop by raising, so the run ends as soon as the
+        queues drain or any task dies, instead of waiting on a queue that
+        nothing consumes any more.
+        """
+        link_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 4)
+        result_queue: asyncio.Queue = asyncio.Queue()
 
-        # Save updated articles
-        temp_file: Path = output_file.with_suffix('.tmp')
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_articles, f, indent=2, ensure_ascii=False)
-            temp_file.replace(output_file)
-        except Exception as e:
-            logging.error(f"Error saving article: {e}")
-            if temp_file.exists():
-                temp_file.unlink()
+            with tqdm(total=0, desc="Processing articles") as pbar:
+                tasks: List[asyncio.Task] = [
+                    asyncio.create_task(self._consume(link_queue, result_queue, pbar))
+                    for _ in range(self.concurrency)
+                ]
+                tasks.append(asyncio.create_task(self._write(result_queue)))
+                tasks.append(asyncio.create_task(self._drain(link_queue, result_queue, pbar)))
+                try:
+                    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()  # Re-raises a dead worker's or writer's error
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await self.close()
+
     def run(self) -> None:
         """Run the crawler."""
         try:
@@ -343,38 +767,15 @@ class TehranTimesCrawler:
                 f"{date_range.end_date.strftime('%Y-%m-%d')}"
             )
 
-            for json_file in tqdm(list(self.input_dir.glob('*.json')), desc="Processing files"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data: Dict = json.load(f)
-
-                    for article_data in tqdm(data['articles'], desc=f"Processing {json_file.name}", leave=False):
-                        link_info: LinkInfo = LinkInfo(
-                            url=article_data['link'],
-                            first_seen_date=data['date'],
-                            title=article_data.get('title', ''),
-                            intro=article_data.get('intro', ''),
-                            time_published=article_data.get('time_published', '')
-                        )
-
-                        content: Optional[Dict] = self.process_article(link_info)
-                        if content:
-                            self.save_article(content)
-
-                        # Rate limiting
-                        time.sleep(random.uniform(1, 2))
-
-                except Exception as e:
-                    logging.error(f"Error processing {json_file}: {e}")
-                    if self.debug:
-                        raise
-                    continue
+            asyncio.run(self._run_async())
 
         except KeyboardInterrupt:
             logging.info("Crawler interrupted by user")
         except Exception as e:
             logging.error(f"Fatal error: {e}")
             raise
+        finally:
+            self.state_manager.close()
 
 def main() -> None:
     """Command-line interface."""
@@ -401,12 +802,28 @@ def main() -> None:
         help='Enable debug mode'
     )
 
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help='Maximum number of concurrent article requests'
+    )
+
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help='Sustained requests per second'
+    )
+
     args: argparse.Namespace = parser.parse_args()
 
     crawler: TehranTimesCrawler = TehranTimesCrawler(
         args.input,
         args.output,
-        args.debug
+        args.debug,
+        args.concurrency,
+        args.rate
     )
 
     crawler.run()
@@ -6,20 +6,31 @@ This module converts raw JSON article data into structured CSV format.
 Handles data validation, transformation, and proper error handling.
 """
 
-import json
-import pandas as pd
+import csv
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 import logging
-from typing import List, Dict, Optional
+from typing import Deque, Iterable, Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import orjson
 from tqdm import tqdm
 
 # Constants
 DEFAULT_CSV_FILENAME = "articles.csv"
 LOG_FILE_FORMAT = "processor_{datetime:%Y%m%d_%H%M%S}.log"
 CSV_SEPARATOR = ";"
-CSV_QUOTE_ALL = 1
+CSV_QUOTE_ALL = csv.QUOTE_ALL
+CSV_BUFFER_SIZE = 1 << 20
+FILES_IN_FLIGHT_PER_WORKER = 2  # Bounds how many files' rows wait for the CSV writer
+CSV_COLUMNS = [
+    'url', 'first_seen_date', 'title', 'subtitle', 'summary', 'body', 'category',
+    'published_date', 'modified_date', 'tags', 'image_url', 'author',
+    'download_timestamp', 'source'
+]
 
 @dataclass
 class Article:
@@ -39,6 +50,88 @@ class Article:
     download_timestamp: str
     source: str = 'tehrantimes'
 
+def _join_list(value: object) -> str:
+    """Return a list field as a comma-separated string."""
+    return ','.join(value) if isinstance(value, list) else ''
+
+def _normalize_article(article: Dict) -> Dict[str, Optional[str]]:
+    """Transform raw article data into a CSV row.
+
+    Args:
+        article: Raw article data dictionary
+
+    Returns:
+        Row dictionary keyed by ``CSV_COLUMNS``
+
+    Raises:
+        ValueError: If a required field is missing
+    """
+    processed: Dict[str, Optional[str]] = {
+        'url': article.get('url'),
+        'first_seen_date': article.get('first_seen_date'),
+        'title': article.get('original_title'),
+        'subtitle': article.get('original_intro', ''),
+        'summary': article.get('summary', ''),
+        'body': article.get('body'),
+        'category': article.get('category'),
+        'published_date': article.get('original_time'),
+        'modified_date': article.get('scraped_date', '*'),
+        'tags': _join_list(article.get('tags')),
+        'image_url': _join_list(article.get('images')),
+        'author': '',  # Not present in Tehran Times
+        'download_timestamp': article.get('download_timestamp'),
+        'source': 'tehrantimes'
+    }
+
+    # Basic validation
+    if not all([processed['url'], processed['title'], processed['body']]):
+        raise ValueError(f"Missing required fields in article: {processed['url']}")
+
+    return processed
+
+def _process_file(json_file: Path) -> Tuple[List[Dict], List[str], Optional[str]]:
+    """Load every article in one JSON or JSONL file as CSV rows.
+
+    Runs in a worker process, so problems are returned to the caller for
+    logging instead of being written to the log from here.
+
+    Args:
+        json_file: Path to the article file
+
+    Returns:
+        Tuple of CSV rows, warnings for skipped articles and a file-level
+        error message (or None)
+    """
+    rows: List[Dict] = []
+    warnings: List[str] = []
+    try:
+        if json_file.suffix == '.jsonl':
+            data: List[Dict] | Dict = []
+            with open(json_file, 'rb') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    # A crawl interrupted mid-write leaves a truncated line behind
+                    try:
+                        data.append(orjson.loads(line))
+                    except orjson.JSONDecodeError as e:
+                        warnings.append(f"Skipping malformed line {line_no} in {json_file}: {e}")
+        else:
+            data = orjson.loads(json_file.read_bytes())
+    except Exception as e:
+        return rows, warnings, f"Error processing {json_file}: {e}"
+
+    # Handle single article, list and JSON Lines formats
+    for article in (data if isinstance(data, list) else [data]):
+        try:
+            rows.append(_normalize_article(article))
+        except ValueError as e:
+            warnings.append(str(e))
+        except Exception as e:
+            warnings.append(f"Error processing article: {e}")
+
+    return rows, warnings, None
+
 class DataProcessor:
     """Process Tehran Times articles into CSV format."""
 
@@ -66,99 +159,66 @@ class DataProcessor:
         )
         logging.info(f"Data processor initialized: {datetime.now()}")
 
-    def load_articles(self) -> List[Dict]:
-        """Load articles from JSON files with proper error handling."""
-        all_articles: List[Dict] = []
-        json_files: List[Path] = list(self.input_dir.glob('*.json'))
-
-        logging.info(f"Processing {len(json_files)} JSON files...")
-
-        for json_file in tqdm(json_files, desc="Reading articles"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data: List[Dict] | Dict = json.load(f)
-
-                # Handle both single article and list formats
-                articles: List[Dict] = data if isinstance(data, list) else [data]
-
-                for article in articles:
-                    processed: Optional[Dict] = self.process_article(article)
-                    if processed:
-                        all_articles.append(processed)
+    def iter_articles(self) -> Iterator[Dict]:
+        """Yield CSV rows for every valid article in the input files.
 
-            except Exception as e:
-                logging.error(f"Error processing {json_file}: {e}")
-                continue
-
-        logging.info(f"Successfully loaded {len(all_articles)} articles")
-        return all_articles
-
-    def process_article(self, article: Dict) -> Optional[Dict]:
-        """Transform raw article data into standardized format.
-
-        Args:
-            article: Raw article data dictionary
-
-        Returns:
-            Processed article dictionary or None if processing fails
+        Files are decoded and normalized in parallel worker processes.
+        At most ``FILES_IN_FLIGHT_PER_WORKER`` files per worker are
+        submitted ahead of the consumer, so memory stays bounded however
+        slowly the rows are written.
         """
-        try:
-            # Convert images list to comma-separated string
-            images_str: str = ','.join(article.get('images', [])) if isinstance(article.get('images'), list) else ''
-
-            # Create standardized article format
-            processed: Dict[str, Optional[str] | List[str]] = {
-                'url': article.get('url'),
-                'first_seen_date': article.get('first_seen_date'),
-                'title': article.get('original_title'),
-                'subtitle': article.get('original_intro', ''),
-                'summary': article.get('summary', ''),
-                'body': article.get('body'),
-                'category': article.get('category'),
-                'published_date': article.get('original_time'),
-                'modified_date': article.get('scraped_date', '*'),
-                'tags': article.get('tags', []),
-                'image_url': images_str,
-                'author': '',  # Not present in Tehran Times
-                'download_timestamp': article.get('download_timestamp'),
-                'source': 'tehrantimes'
-            }
-
-            # Basic validation
-            if not all([processed['url'], processed['title'], processed['body']]):
-                logging.warning(f"Missing required fields in article: {processed['url']}")
-                return None
-
-            return processed
+        json_files: List[Path] = list(self.input_dir.glob('*.json')) + list(self.input_dir.glob('*.jsonl'))
 
-        except Exception as e:
-            logging.error(f"Error processing article: {e}")
-            return None
+        logging.info(f"Processing {len(json_files)} JSON files...")
 
-    def save_to_csv(self, articles: List[Dict], filename: str = DEFAULT_CSV_FILENAME) -> None:
-        """Save processed articles to CSV with proper formatting.
+        workers: int = os.cpu_count() or 1
+        max_in_flight: int = workers * FILES_IN_FLIGHT_PER_WORKER
+        pending: Deque[Future] = deque()
+        files: Iterator[Path] = iter(json_files)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor, \
+                tqdm(total=len(json_files), desc="Reading articles") as pbar:
+            while True:
+                # Top up the window, then hand out results in input order
+                for json_file in files:
+                    pending.append(executor.submit(_process_file, json_file))
+                    if len(pending) >= max_in_flight:
+                        break
+                if not pending:
+                    break
+
+                rows, warnings, error = pending.popleft().result()
+                pbar.update()
+                for warning in warnings:
+                    logging.warning(warning)
+                if error:
+                    logging.error(error)
+                yield from rows
+
+    def save_to_csv(self, rows: Iterable[Dict], filename: str = DEFAULT_CSV_FILENAME) -> None:
+        """Stream processed articles to CSV with proper formatting.
 
         Args:
-            articles: List of processed article dictionaries
+            rows: Processed article rows keyed by ``CSV_COLUMNS``
             filename: Output CSV filename
         """
         try:
-            df: pd.DataFrame = pd.DataFrame(articles)
-
-            # Convert tags list to string
-            df['tags'] = df['tags'].apply(lambda x: ','.join(x) if isinstance(x, list) else str(x))
-
-            # Save CSV with proper formatting
             output_path: Path = self.output_dir / filename
-            df.to_csv(
-                output_path,
-                sep=CSV_SEPARATOR,
-                quoting=CSV_QUOTE_ALL,  # Quote all fields
-                encoding='utf-8',
-                index=False
-            )
-
-            logging.info(f"Successfully saved {len(df)} articles to {output_path}")
+            written: int = 0
+            with open(output_path, 'w', encoding='utf-8', newline='', buffering=CSV_BUFFER_SIZE) as f:
+                writer = csv.DictWriter(
+                    f,
+                    fieldnames=CSV_COLUMNS,
+                    delimiter=CSV_SEPARATOR,
+                    quoting=CSV_QUOTE_ALL,  # Quote all fields
+                    lineterminator=os.linesep
+                )
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow(row)
+                    written += 1
+
+            logging.info(f"Successfully saved {written} articles to {output_path}")
 
         except Exception as e:
             logging.error(f"Error saving CSV: {e}")
@@ -167,15 +227,16 @@ class DataProcessor:
     def process(self) -> None:
         """Run the complete processing pipeline."""
         try:
-            # Load and process articles
-            articles: List[Dict] = self.load_articles()
+            # Load and process articles lazily
+            rows: Iterator[Dict] = self.iter_articles()
+            first: Optional[Dict] = next(rows, None)
 
-            if not articles:
+            if first is None:
                 logging.error("No articles found to process")
                 return
 
-            # Save to CSV
-            self.save_to_csv(articles)
+            # Stream to CSV
+            self.save_to_csv(chain([first], rows))
 
             logging.info("Processing completed successfully")
 
@@ -0,0 +1,67 @@
+"""Tests for the archive crawler's single-pass archive page parser."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src' / 'crawling'))
+
+from archive_crawler import parse_archive_page
+
+
+def _page(*items: str) -> bytes:
+    return ('<html><body><ul>' + ''.join(items) + '</ul></body></html>').encode('utf-8')
+
+
+def _item(inner: str, classes: str = 'clearfix news') -> str:
+    return f'<li class="{classes}">{inner}</li>'
+
+
+COMPLETE = (
+    '<a href="/news/1/First">link</a>'
+    '<h3>First title</h3>'
+    '<span class="item-time ltr" title="2024-01-02 10:00">10:00</span>'
+    '<p class="introtext">First intro</p>'
+)
+
+EXPECTED = {
+    'link': '/news/1/First',
+    'title': 'First title',
+    'time_published': '2024-01-02 10:00',
+    'intro': 'First intro',
+}
+
+
+def test_item_classes_match_in_any_order() -> None:
+    target = parse_archive_page(_page(_item(COMPLETE, 'news clearfix')))
+    assert target.entries == [EXPECTED]
+    assert target.errors == []
+
+
+def test_nested_li_does_not_end_the_item() -> None:
+    inner = (
+        '<a href="/news/1/First">link</a>'
+        '<ul><li>tag</li></ul>'
+        '<h3>First title</h3>'
+        '<span class="item-time ltr" title="2024-01-02 10:00">10:00</span>'
+        '<p class="introtext">First intro</p>'
+    )
+    target = parse_archive_page(_page(_item(inner)))
+    assert target.entries == [EXPECTED]
+
+
+def test_anchor_without_href_is_skipped() -> None:
+    target = parse_archive_page(_page(_item('<a name="top"></a>' + COMPLETE)))
+    assert target.entries[0]['link'] == '/news/1/First'
+
+
+def test_title_keeps_text_of_inline_markup() -> None:
+    inner = COMPLETE.replace('<h3>First title</h3>', '<h3> <b>First</b> <i>title</i> </h3>')
+    target = parse_archive_page(_page(_item(inner)))
+    assert target.entries[0]['title'] == 'First title'
+
+
+def test_item_missing_a_field_is_reported() -> None:
+    incomplete = COMPLETE.replace('<p class="introtext">First intro</p>', '')
+    target = parse_archive_page(_page(_item(incomplete), _item(COMPLETE)))
+    assert target.entries == [EXPECTED]
+    assert target.errors == ['missing intro']
@@ -0,0 +1,59 @@
+"""Tests for the article scraper's write-ahead-logged state."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src' / 'crawling'))
+
+import article_scraper
+from article_scraper import ScrapingStatus, StateManager
+
+
+def _abandon(manager: StateManager) -> None:
+    """Drop a manager without snapshotting, as a killed process would."""
+    manager._urls_log_fh.close()
+    manager._images_log_fh.close()
+
+
+def test_replay_restores_unsnapshotted_updates(tmp_path: Path) -> None:
+    manager = StateManager(tmp_path)
+    manager.update_url_status('https://example.com/a', ScrapingStatus.SUCCESS)
+    _abandon(manager)
+
+    replayed = StateManager(tmp_path)
+    assert replayed.urls_with_status(ScrapingStatus.SUCCESS) == {'https://example.com/a'}
+    replayed.close()
+
+
+def test_entry_after_torn_line_survives_replay(tmp_path: Path) -> None:
+    manager = StateManager(tmp_path)
+    manager.update_url_status('https://example.com/a', ScrapingStatus.SUCCESS)
+    _abandon(manager)
+    with open(tmp_path / article_scraper.URLS_LOG_FILE_NAME, 'ab') as f:
+        f.write(b'["https://example.com/torn", {"sta')
+
+    resumed = StateManager(tmp_path)
+    resumed.update_url_status('https://example.com/b', ScrapingStatus.SUCCESS)
+    _abandon(resumed)
+
+    replayed = StateManager(tmp_path)
+    assert replayed.urls_with_status(ScrapingStatus.SUCCESS) == {
+        'https://example.com/a', 'https://example.com/b'
+    }
+    replayed.close()
+
+
+def test_failed_snapshot_keeps_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = StateManager(tmp_path)
+    manager.update_url_status('https://example.com/a', ScrapingStatus.SUCCESS)
+    monkeypatch.setattr(StateManager, '_save_json_compact', lambda self, path, data: False)
+    manager.flush(force=True)
+    monkeypatch.undo()
+    _abandon(manager)
+
+    assert (tmp_path / article_scraper.URLS_LOG_FILE_NAME).stat().st_size > 0
+    replayed = StateManager(tmp_path)
+    assert replayed.urls_with_status(ScrapingStatus.SUCCESS) == {'https://example.com/a'}
+    replayed.close()